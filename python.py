@@ -1,17 +1,31 @@
+import os
 import sys
+import weakref
+from collections import deque
 import matplotlib.pyplot as plt
-import matplotlib.patches as patches
 import numpy as np
 import pandas as pd
 import matplotlib
 import random
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                            QLabel, QPushButton, QTabWidget, QTableWidget, QTableWidgetItem,
+                            QLabel, QPushButton, QTabWidget, QTableView,
                             QComboBox, QLineEdit, QFormLayout, QSpinBox, QScrollArea, QSplitter,
                             QHeaderView, QMessageBox, QGroupBox, QGridLayout)
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QFont, QColor, QPalette, QBrush, QLinearGradient, QIcon
+from PyQt5.QtCore import Qt, QTimer, QRect, QRectF, QSize, QThread, QSignalBlocker, pyqtSignal
+from PyQt5.QtGui import (QFont, QColor, QPalette, QBrush, QLinearGradient, QIcon,
+                         QStandardItemModel, QStandardItem, QPainter, QPen, QPixmap, QImage)
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from sortedcontainers import SortedList
+from scheduler_core import NUMBA_AVAILABLE, run_fcfs, sjf_kernel, rr_kernel, priority_kernel
+
+try:
+    import pyqtgraph as pg
+except ImportError:
+    pg = None
+
+# The metrics charts use pyqtgraph when it is installed; USE_MATPLOTLIB=1 keeps the
+# matplotlib version
+USE_MATPLOTLIB = pg is None or os.environ.get("USE_MATPLOTLIB", "0") not in ("", "0")
 
 # Set the style for matplotlib
 plt.style.use('dark_background')
@@ -24,7 +38,39 @@ ACCENT_COLOR = "#64b5f6"
 TEXT_COLOR = "#e0e0e0"
 HIGHLIGHT_COLOR = "#03a9f4"
 
+# Viridis sampled once; indexing it matches calling plt.cm.viridis on a float
+COLOR_LUT = plt.cm.viridis(np.linspace(0, 1, 256))
+
+
+def _qt_palette():
+    # Qt versions of COLOR_LUT, built once and shared by every process table and chart
+    block_colors, brushes, text_brushes = [], [], []
+    white, black = QBrush(Qt.white), QBrush(Qt.black)
+    for rgba in COLOR_LUT:
+        rgb = [int(c * 255) for c in rgba[:3]]
+        brushes.append(QBrush(QColor(*rgb)))
+        text_brushes.append(white if sum(rgb) / 3 < 128 else black)  # Readable on the brush
+        block_color = QColor(*rgb)
+        block_color.setAlphaF(0.7)
+        block_colors.append(block_color)
+    return brushes, text_brushes, block_colors
+
+
+# Indexed like COLOR_LUT; the fill colors are the 70% alpha ones for Gantt blocks and bars
+PROCESS_BRUSHES, PROCESS_TEXT_BRUSHES, PROCESS_FILL_COLORS = _qt_palette()
+
+# Theme colors as Qt objects for the painted widgets
+DARK_QCOLOR = QColor(DARK_COLOR)
+TEXT_QCOLOR = QColor(TEXT_COLOR)
+GRID_QCOLOR = QColor(TEXT_COLOR)
+GRID_QCOLOR.setAlphaF(0.3)
+
 class Process:
+    # Fixed attribute set: smaller instances and faster attribute access in step()
+    __slots__ = ('pid', 'arrival_time', 'burst_time', 'remaining_time', 'priority',
+                 'start_time', 'finish_time', 'waiting_time', 'turnaround_time', 'response_time',
+                 'color', 'color_index')
+    
     def __init__(self, pid, arrival_time, burst_time, priority=0):
         self.pid = pid
         self.arrival_time = arrival_time
@@ -36,13 +82,31 @@ class Process:
         self.waiting_time = 0
         self.turnaround_time = 0
         self.response_time = None
+        self.color_index = self.lut_index(pid)  # Into COLOR_LUT and the Qt palettes
         self.color = self.generate_color()
-        self.execution_sequence = []  # Stores (start, duration) tuples for Gantt visualization
+    
+    def clone(self):
+        # Same process with fresh runtime state; the fixed fields and the derived
+        # colors are shared rather than rebuilt
+        process = Process.__new__(Process)
+        process.pid = self.pid
+        process.arrival_time = self.arrival_time
+        process.burst_time = self.burst_time
+        process.priority = self.priority
+        process.color = self.color
+        process.color_index = self.color_index
+        process.reset()
+        return process
+    
+    @staticmethod
+    def lut_index(pid):
+        # Color table entry for a process ID
+        hue = (pid * 0.15) % 1.0
+        return int(hue * len(COLOR_LUT))
     
     def generate_color(self):
         # Generate a pastel color based on process ID
-        hue = (self.pid * 0.15) % 1.0
-        return plt.cm.viridis(hue)
+        return COLOR_LUT[self.color_index]
     
     def reset(self):
         self.remaining_time = self.burst_time
@@ -51,7 +115,6 @@ class Process:
         self.waiting_time = 0
         self.turnaround_time = 0
         self.response_time = None
-        self.execution_sequence = []
 
 
 class SchedulingAlgorithm:
@@ -61,10 +124,102 @@ class SchedulingAlgorithm:
         self.current_process = None
         self.ready_queue = []
         self.completed_processes = []
-        self.execution_history = []  # For Gantt chart: (time, pid, duration)
+        self.execution_history = []  # For Gantt chart: [time, pid, duration], duration grows in place
+        self._max_time = 0  # End of the latest execution block, i.e. the chart's width
+        self._sum_wait = 0.0  # Running totals over completed_processes for the averages
+        self._sum_turn = 0.0
+        self._sum_resp = 0.0
+        self._is_fresh = True  # Nothing has run since construction or the last reset()
+        self._sort_arrivals()
     
     def add_process(self, process):
         self.processes.append(process)
+        self._sync_arrivals()
+    
+    def _sort_arrivals(self):
+        # Processes in arrival order plus a cursor to the next one that has not arrived yet
+        self._arrivals_sorted = sorted(self.processes, key=lambda p: p.arrival_time)
+        self._sorted_from = (self.processes, len(self.processes))
+        self._arrivals_reordered = False
+        self._next_arrival_idx = 0
+        self._spec_cache = None
+        self._metrics = None
+    
+    def _sync_arrivals(self):
+        # Pick up a process list that was replaced or grown without a reset(): processes
+        # that already arrived stay behind the cursor, the rest queue up in arrival order
+        if not self._processes_changed():
+            return
+        present = {id(p) for p in self.processes}
+        arrived = [p for p in self._arrivals_sorted[:self._next_arrival_idx] if id(p) in present]
+        arrived_ids = {id(p) for p in arrived}
+        pending = sorted((p for p in self.processes if id(p) not in arrived_ids),
+                         key=lambda p: p.arrival_time)
+        self._arrivals_sorted = arrived + pending
+        self._sorted_from = (self.processes, len(self.processes))
+        self._next_arrival_idx = len(arrived)
+        self._spec_cache = None
+        self._metrics = None
+        # The arrived part can be out of arrival order now, so reset() sorts from scratch
+        self._arrivals_reordered = bool(arrived)
+    
+    def _processes_changed(self):
+        # True when self.processes was replaced or grown since the last _sort_arrivals()
+        source, count = self._sorted_from
+        return source is not self.processes or count != len(self.processes)
+    
+    def _spec_arrays(self):
+        # (arrival, burst, priority) as int64 arrays in arrival order, for the kernels.
+        # They only change with the process list, so reset() keeps them. The order is
+        # the one reset() sorts into, since _load_kernel_result() replays from a reset
+        if (self._spec_cache is None or self._spec_from[0] is not self.processes or
+                self._spec_from[1] != len(self.processes)):
+            processes = sorted(self.processes, key=lambda p: p.arrival_time)
+            count = len(processes)
+            self._spec_from = (self.processes, count)
+            self._spec_cache = (
+                np.fromiter((p.arrival_time for p in processes), dtype=np.int64, count=count),
+                np.fromiter((p.burst_time for p in processes), dtype=np.int64, count=count),
+                np.fromiter((p.priority for p in processes), dtype=np.int64, count=count),
+            )
+        return self._spec_cache
+    
+    def metrics_arrays(self):
+        # Per-process chart data as arrays in self.processes order: 'pid', 'burst',
+        # 'color_index', and 'wait'/'turn', which _record_completion keeps current
+        if self._metrics is None or self._processes_changed():
+            processes = self.processes
+            count = len(processes)
+            self._metrics = {
+                'pid': np.fromiter((p.pid for p in processes), dtype=np.int32, count=count),
+                'burst': np.fromiter((p.burst_time for p in processes), dtype=np.int32, count=count),
+                'color_index': np.fromiter((p.color_index for p in processes), dtype=np.int32, count=count),
+                'wait': np.fromiter((p.waiting_time for p in processes), dtype=np.int32, count=count),
+                'turn': np.fromiter((p.turnaround_time for p in processes), dtype=np.int32, count=count),
+            }
+            self._metrics_row = {p.pid: row for row, p in enumerate(processes)}
+        return self._metrics
+    
+    def _take_arrivals(self):
+        # Return the processes that have arrived by the current time and advance the cursor
+        self._sync_arrivals()
+        start = self._next_arrival_idx
+        while (self._next_arrival_idx < len(self._arrivals_sorted) and
+               self._arrivals_sorted[self._next_arrival_idx].arrival_time <= self.time):
+            self._next_arrival_idx += 1
+        return self._arrivals_sorted[start:self._next_arrival_idx]
+    
+    def _run_length(self, limit, max_dt):
+        # Ticks until the next scheduling event: the running process hitting `limit`,
+        # the next arrival, or `max_dt` (None means no cap)
+        dt = max_dt
+        if limit is not None and (dt is None or limit < dt):
+            dt = limit
+        if self._next_arrival_idx < len(self._arrivals_sorted):
+            until_arrival = self._arrivals_sorted[self._next_arrival_idx].arrival_time - self.time
+            if dt is None or until_arrival < dt:
+                dt = until_arrival
+        return dt if dt is not None else 1
     
     def reset(self):
         self.time = 0
@@ -72,78 +227,158 @@ class SchedulingAlgorithm:
         self.ready_queue = []
         self.completed_processes = []
         self.execution_history = []
+        self._max_time = 0
+        self._sum_wait = 0.0
+        self._sum_turn = 0.0
+        self._sum_resp = 0.0
+        self._is_fresh = True
+        if self._processes_changed() or self._arrivals_reordered:
+            self._sort_arrivals()
+        else:
+            # Same processes: the sorted order and the cached arrays still apply
+            self._next_arrival_idx = 0
+            if self._metrics is not None:
+                self._metrics['wait'].fill(0)
+                self._metrics['turn'].fill(0)
         for process in self.processes:
             process.reset()
     
+    def _extend_block(self, dt):
+        # Grow the running execution block by dt and keep _max_time up to date
+        block = self.execution_history[-1]
+        block[2] += dt
+        if block[0] + block[2] > self._max_time:
+            self._max_time = block[0] + block[2]
+    
+    def _record_completion(self, process):
+        self.completed_processes.append(process)
+        if self._metrics is not None:
+            row = self._metrics_row[process.pid]
+            self._metrics['wait'][row] = process.waiting_time
+            self._metrics['turn'][row] = process.turnaround_time
+        self._sum_wait += process.waiting_time
+        self._sum_turn += process.turnaround_time
+        if process.response_time is not None:
+            self._sum_resp += process.response_time
+    
     def is_completed(self):
         return len(self.completed_processes) == len(self.processes)
     
     def get_average_waiting_time(self):
         if not self.completed_processes:
             return 0
-        return sum(p.waiting_time for p in self.completed_processes) / len(self.completed_processes)
+        return self._sum_wait / len(self.completed_processes)
     
     def get_average_turnaround_time(self):
         if not self.completed_processes:
             return 0
-        return sum(p.turnaround_time for p in self.completed_processes) / len(self.completed_processes)
+        return self._sum_turn / len(self.completed_processes)
 
     def get_average_response_time(self):
         if not self.completed_processes:
             return 0
-        return sum(p.response_time for p in self.completed_processes if p.response_time is not None) / len(self.completed_processes)
+        return self._sum_resp / len(self.completed_processes)
     
-    def update_waiting_times(self):
-        for process in self.processes:
-            if (process not in self.completed_processes and 
-                process != self.current_process and 
-                process.arrival_time <= self.time and
-                process.remaining_time > 0):
-                process.waiting_time += 1
-    
-    def step(self):
-        # To be implemented by subclasses
+    def get_execution_sequences(self):
+        # Per-process (start, duration) blocks, built from execution_history in one pass
+        # (the running block is included with its duration so far)
+        sequences = {process.pid: [] for process in self.processes}
+        for start, pid, duration in self.execution_history:
+            sequences[pid].append((start, duration))
+        return sequences
+    
+    def step(self, max_dt=1):
+        # To be implemented by subclasses: advance the simulation by at most max_dt time units
         pass
+    
+    def _run_kernel(self, arrival, burst, priority):
+        # Compiled equivalent of fast_run() from scheduler_core, None if there is none
+        return None
+    
+    def fast_run(self):
+        # Run to completion, jumping straight from one scheduling event to the next
+        if NUMBA_AVAILABLE and not self.is_completed():
+            # The simulation is deterministic, so replaying it from time 0 in the
+            # compiled kernel ends in the same state as finishing this run
+            result = self._run_kernel(*self._spec_arrays())
+            if result is not None:
+                self._load_kernel_result(result)
+                return
+        
+        while self.step(max_dt=None):
+            pass
+    
+    def _load_kernel_result(self, result):
+        # Copy a scheduler_core run back onto the processes (indexed in arrival order)
+        start, finish, response, order, hist_start, hist_proc, hist_dur, end_time = result
+        self.reset()
+        processes = self._arrivals_sorted
+        
+        for process, start_time, finish_time, response_time in zip(
+                processes, start.tolist(), finish.tolist(), response.tolist()):
+            process.remaining_time = 0
+            process.start_time = start_time
+            process.finish_time = finish_time
+            process.turnaround_time = finish_time - process.arrival_time
+            process.waiting_time = process.turnaround_time - process.burst_time
+            process.response_time = response_time
+        
+        for start_time, index, duration in zip(hist_start.tolist(), hist_proc.tolist(), hist_dur.tolist()):
+            self.execution_history.append([start_time, processes[index].pid, duration])
+            self._max_time = max(self._max_time, start_time + duration)
+        
+        for index in order.tolist():
+            self._record_completion(processes[index])
+        self._is_fresh = not processes
+        self._next_arrival_idx = len(processes)
+        self.time = int(end_time)
 
 
 class FCFSScheduling(SchedulingAlgorithm):
-    def step(self):
+    def __init__(self, processes=None):
+        super().__init__(processes)
+        self.ready_queue = deque()
+    
+    def reset(self):
+        super().reset()
+        self.ready_queue = deque()
+    
+    def _run_kernel(self, arrival, burst, priority):
+        return run_fcfs(arrival, burst)
+    
+    def step(self, max_dt=1):
         if self.is_completed():
             return False
+        self._is_fresh = False
         
         # Check for new arriving processes
-        new_arrivals = [p for p in self.processes 
-                      if p.arrival_time == self.time 
-                      and p not in self.ready_queue 
-                      and p not in self.completed_processes]
+        new_arrivals = self._take_arrivals()
         
         for process in new_arrivals:
             self.ready_queue.append(process)
         
         # If no process is running, get the next from the queue
         if self.current_process is None and self.ready_queue:
-            self.current_process = self.ready_queue.pop(0)
+            self.current_process = self.ready_queue.popleft()
             self.current_process.start_time = self.time
             self.current_process.response_time = self.time - self.current_process.arrival_time
-            self.execution_history.append((self.time, self.current_process.pid, 0))  # Start new execution block
+            self.execution_history.append([self.time, self.current_process.pid, 0])  # Start new execution block
         
-        # Update the current running process
+        # Run the current process up to the next event
+        dt = self._run_length(self.current_process.remaining_time if self.current_process else None, max_dt)
         if self.current_process:
-            self.current_process.remaining_time -= 1
-            self.execution_history[-1] = (self.execution_history[-1][0], self.execution_history[-1][1], 
-                                         self.execution_history[-1][2] + 1)  # Update duration
+            self.current_process.remaining_time -= dt
+            self._extend_block(dt)  # Update duration
             
             # If process is completed
             if self.current_process.remaining_time == 0:
-                self.current_process.finish_time = self.time + 1
+                self.current_process.finish_time = self.time + dt
                 self.current_process.turnaround_time = self.current_process.finish_time - self.current_process.arrival_time
-                self.current_process.execution_sequence.append((self.current_process.start_time, 
-                                                              self.current_process.finish_time - self.current_process.start_time))
-                self.completed_processes.append(self.current_process)
+                self.current_process.waiting_time = self.current_process.turnaround_time - self.current_process.burst_time
+                self._record_completion(self.current_process)
                 self.current_process = None
         
-        self.update_waiting_times()
-        self.time += 1
+        self.time += dt
         return True
 
 
@@ -151,67 +386,70 @@ class SJFScheduling(SchedulingAlgorithm):
     def __init__(self, processes=None, preemptive=False):
         super().__init__(processes)
         self.preemptive = preemptive
+        self.ready_queue = self._new_ready_queue()
     
-    def step(self):
+    def reset(self):
+        super().reset()
+        self.ready_queue = self._new_ready_queue()
+    
+    @staticmethod
+    def _new_ready_queue():
+        # Kept sorted by remaining_time; equal keys stay in the order they were added
+        return SortedList(key=lambda p: p.remaining_time)
+    
+    def _run_kernel(self, arrival, burst, priority):
+        return sjf_kernel(self.preemptive)(arrival, burst)
+    
+    def step(self, max_dt=1):
         if self.is_completed():
             return False
+        self._is_fresh = False
         
         # Check for new arriving processes
-        new_arrivals = [p for p in self.processes 
-                      if p.arrival_time == self.time 
-                      and p not in self.ready_queue 
-                      and p not in self.completed_processes
-                      and p != self.current_process]
+        new_arrivals = self._take_arrivals()
         
         for process in new_arrivals:
-            self.ready_queue.append(process)
+            self.ready_queue.add(process)
         
         # If preemptive, we need to check if a new process has shorter burst time
-        if self.preemptive and self.current_process:
-            shortest_job = min(self.ready_queue + ([self.current_process] if self.current_process else []), 
-                              key=lambda p: p.remaining_time, default=None)
-            
-            if shortest_job != self.current_process and shortest_job in self.ready_queue:
+        # Only the queue head can beat the running process, so compare against it directly
+        # (a tie with the head also preempts, matching the original min() over queue + current)
+        if self.preemptive and self.current_process and self.ready_queue:
+            if self.ready_queue[0].remaining_time <= self.current_process.remaining_time:
                 # Preempt the current process
-                self.ready_queue.remove(shortest_job)
+                shortest_job = self.ready_queue.pop(0)
                 
-                if self.current_process:
-                    self.ready_queue.append(self.current_process)
-                    self.current_process.execution_sequence.append((self.current_process.start_time, 
-                                                                 self.time - self.current_process.start_time))
+                self.ready_queue.add(self.current_process)
                 
                 self.current_process = shortest_job
                 self.current_process.start_time = self.time
                 if self.current_process.response_time is None:
                     self.current_process.response_time = self.time - self.current_process.arrival_time
-                self.execution_history.append((self.time, self.current_process.pid, 0))
+                self.execution_history.append([self.time, self.current_process.pid, 0])
         
         # If no process is running, get the shortest job from the queue
         if self.current_process is None and self.ready_queue:
-            self.ready_queue.sort(key=lambda p: p.remaining_time)
             self.current_process = self.ready_queue.pop(0)
             self.current_process.start_time = self.time
             if self.current_process.response_time is None:
                 self.current_process.response_time = self.time - self.current_process.arrival_time
-            self.execution_history.append((self.time, self.current_process.pid, 0))
+            self.execution_history.append([self.time, self.current_process.pid, 0])
         
-        # Update the current running process
+        # Run the current process up to the next event
+        dt = self._run_length(self.current_process.remaining_time if self.current_process else None, max_dt)
         if self.current_process:
-            self.current_process.remaining_time -= 1
-            self.execution_history[-1] = (self.execution_history[-1][0], self.execution_history[-1][1], 
-                                         self.execution_history[-1][2] + 1)
+            self.current_process.remaining_time -= dt
+            self._extend_block(dt)
             
             # If process is completed
             if self.current_process.remaining_time == 0:
-                self.current_process.finish_time = self.time + 1
+                self.current_process.finish_time = self.time + dt
                 self.current_process.turnaround_time = self.current_process.finish_time - self.current_process.arrival_time
-                self.current_process.execution_sequence.append((self.current_process.start_time, 
-                                                              self.current_process.finish_time - self.current_process.start_time))
-                self.completed_processes.append(self.current_process)
+                self.current_process.waiting_time = self.current_process.turnaround_time - self.current_process.burst_time
+                self._record_completion(self.current_process)
                 self.current_process = None
         
-        self.update_waiting_times()
-        self.time += 1
+        self.time += dt
         return True
 
 
@@ -220,21 +458,23 @@ class RoundRobinScheduling(SchedulingAlgorithm):
         super().__init__(processes)
         self.time_quantum = time_quantum
         self.current_time_slice = 0
+        self.ready_queue = deque()
     
     def reset(self):
         super().reset()
         self.current_time_slice = 0
+        self.ready_queue = deque()
     
-    def step(self):
+    def _run_kernel(self, arrival, burst, priority):
+        return rr_kernel(self.time_quantum)(arrival, burst)
+    
+    def step(self, max_dt=1):
         if self.is_completed():
             return False
+        self._is_fresh = False
         
         # Check for new arriving processes
-        new_arrivals = [p for p in self.processes 
-                      if p.arrival_time == self.time 
-                      and p not in self.ready_queue 
-                      and p not in self.completed_processes
-                      and p != self.current_process]
+        new_arrivals = self._take_arrivals()
         
         for process in new_arrivals:
             self.ready_queue.append(process)
@@ -243,36 +483,37 @@ class RoundRobinScheduling(SchedulingAlgorithm):
         if (self.current_process is None or self.current_time_slice >= self.time_quantum) and self.ready_queue:
             if self.current_process and self.current_process.remaining_time > 0:
                 # Time slice expired, but process not finished
-                self.current_process.execution_sequence.append(
-                    (self.current_process.start_time, self.time - self.current_process.start_time))
                 self.ready_queue.append(self.current_process)
             
-            self.current_process = self.ready_queue.pop(0)
+            self.current_process = self.ready_queue.popleft()
             self.current_process.start_time = self.time
             if self.current_process.response_time is None:
                 self.current_process.response_time = self.time - self.current_process.arrival_time
             self.current_time_slice = 0
-            self.execution_history.append((self.time, self.current_process.pid, 0))
+            self.execution_history.append([self.time, self.current_process.pid, 0])
         
-        # Update the current running process
+        # Run the current process up to the next event; the slice only caps it while unexpired
+        limit = None
+        if self.current_process:
+            limit = self.current_process.remaining_time
+            if self.current_time_slice < self.time_quantum:
+                limit = min(limit, self.time_quantum - self.current_time_slice)
+        dt = self._run_length(limit, max_dt)
         if self.current_process:
-            self.current_process.remaining_time -= 1
-            self.current_time_slice += 1
-            self.execution_history[-1] = (self.execution_history[-1][0], self.execution_history[-1][1], 
-                                         self.execution_history[-1][2] + 1)
+            self.current_process.remaining_time -= dt
+            self.current_time_slice += dt
+            self._extend_block(dt)
             
             # If process is completed
             if self.current_process.remaining_time == 0:
-                self.current_process.finish_time = self.time + 1
+                self.current_process.finish_time = self.time + dt
                 self.current_process.turnaround_time = self.current_process.finish_time - self.current_process.arrival_time
-                self.current_process.execution_sequence.append((self.current_process.start_time, 
-                                                              self.current_process.finish_time - self.current_process.start_time))
-                self.completed_processes.append(self.current_process)
+                self.current_process.waiting_time = self.current_process.turnaround_time - self.current_process.burst_time
+                self._record_completion(self.current_process)
                 self.current_process = None
                 self.current_time_slice = 0
         
-        self.update_waiting_times()
-        self.time += 1
+        self.time += dt
         return True
 
 
@@ -280,143 +521,249 @@ class PriorityScheduling(SchedulingAlgorithm):
     def __init__(self, processes=None, preemptive=False):
         super().__init__(processes)
         self.preemptive = preemptive
+        self.ready_queue = self._new_ready_queue()
     
-    def step(self):
+    def reset(self):
+        super().reset()
+        self.ready_queue = self._new_ready_queue()
+    
+    @staticmethod
+    def _new_ready_queue():
+        # Kept sorted by priority; equal keys stay in the order they were added
+        return SortedList(key=lambda p: p.priority)
+    
+    def _run_kernel(self, arrival, burst, priority):
+        return priority_kernel(self.preemptive)(arrival, burst, priority)
+    
+    def step(self, max_dt=1):
         if self.is_completed():
             return False
+        self._is_fresh = False
         
         # Check for new arriving processes
-        new_arrivals = [p for p in self.processes 
-                      if p.arrival_time == self.time 
-                      and p not in self.ready_queue 
-                      and p not in self.completed_processes
-                      and p != self.current_process]
+        new_arrivals = self._take_arrivals()
         
         for process in new_arrivals:
-            self.ready_queue.append(process)
+            self.ready_queue.add(process)
         
         # If preemptive, we need to check if a new process has higher priority
-        if self.preemptive and self.current_process:
-            highest_priority = min(self.ready_queue + ([self.current_process] if self.current_process else []), 
-                                 key=lambda p: p.priority, default=None)
-            
-            if highest_priority != self.current_process and highest_priority in self.ready_queue:
+        # Only the queue head can beat the running process, so compare against it directly
+        # (a tie with the head also preempts, matching the original min() over queue + current)
+        if self.preemptive and self.current_process and self.ready_queue:
+            if self.ready_queue[0].priority <= self.current_process.priority:
                 # Preempt the current process
-                self.ready_queue.remove(highest_priority)
+                highest_priority = self.ready_queue.pop(0)
                 
-                if self.current_process:
-                    self.ready_queue.append(self.current_process)
-                    self.current_process.execution_sequence.append((self.current_process.start_time, 
-                                                                 self.time - self.current_process.start_time))
+                self.ready_queue.add(self.current_process)
                 
                 self.current_process = highest_priority
                 self.current_process.start_time = self.time
                 if self.current_process.response_time is None:
                     self.current_process.response_time = self.time - self.current_process.arrival_time
-                self.execution_history.append((self.time, self.current_process.pid, 0))
+                self.execution_history.append([self.time, self.current_process.pid, 0])
         
         # If no process is running, get the highest priority job from the queue
         if self.current_process is None and self.ready_queue:
-            self.ready_queue.sort(key=lambda p: p.priority)
             self.current_process = self.ready_queue.pop(0)
             self.current_process.start_time = self.time
             if self.current_process.response_time is None:
                 self.current_process.response_time = self.time - self.current_process.arrival_time
-            self.execution_history.append((self.time, self.current_process.pid, 0))
+            self.execution_history.append([self.time, self.current_process.pid, 0])
         
-        # Update the current running process
+        # Run the current process up to the next event; equal priorities keep preempting
+        # each other every tick, so only single-step while one is waiting
+        limit = None
         if self.current_process:
-            self.current_process.remaining_time -= 1
-            self.execution_history[-1] = (self.execution_history[-1][0], self.execution_history[-1][1], 
-                                         self.execution_history[-1][2] + 1)
+            limit = self.current_process.remaining_time
+            if self.preemptive and self.ready_queue and self.ready_queue[0].priority <= self.current_process.priority:
+                limit = 1
+        dt = self._run_length(limit, max_dt)
+        if self.current_process:
+            self.current_process.remaining_time -= dt
+            self._extend_block(dt)
             
             # If process is completed
             if self.current_process.remaining_time == 0:
-                self.current_process.finish_time = self.time + 1
+                self.current_process.finish_time = self.time + dt
                 self.current_process.turnaround_time = self.current_process.finish_time - self.current_process.arrival_time
-                self.current_process.execution_sequence.append((self.current_process.start_time, 
-                                                              self.current_process.finish_time - self.current_process.start_time))
-                self.completed_processes.append(self.current_process)
+                self.current_process.waiting_time = self.current_process.turnaround_time - self.current_process.burst_time
+                self._record_completion(self.current_process)
                 self.current_process = None
         
-        self.update_waiting_times()
-        self.time += 1
+        self.time += dt
         return True
 
 
-class GanttChartWidget(FigureCanvas):
+class GanttChartWidget(QWidget):
+    # Drawn directly with QPainter: the chart is only a row of rectangles and labels,
+    # so the matplotlib pipeline is not worth its cost on every step
+    MARGIN_LEFT = 20
+    MARGIN_RIGHT = 20
+    
     def __init__(self, parent=None, width=8, height=2, dpi=100):
-        self.fig = plt.Figure(figsize=(width, height), dpi=dpi, tight_layout=True)
-        self.axes = self.fig.add_subplot(111)
-        super().__init__(self.fig)
-        
-        self.setParent(parent)
+        super().__init__(parent)
+        self._size_hint = QSize(int(width * dpi), int(height * dpi))
+        self.setMinimumHeight(int(height * dpi))
         self.processes = []
         self.algorithm = None
         
-        # Set the colors
-        self.fig.patch.set_facecolor(DARK_COLOR)
-        self.axes.set_facecolor(DARK_COLOR)
-        self.axes.tick_params(colors=TEXT_COLOR)
-        self.axes.xaxis.label.set_color(TEXT_COLOR)
-        self.axes.yaxis.label.set_color(TEXT_COLOR)
+        # The chart is rendered into a pixmap and only re-rendered when the schedule
+        # or the widget size changed; other repaints (tab switches, exposes) just blit it
+        self._pixmap = None
+        self._drawn_state = None  # (algorithm, history, time, block count) in the pixmap
         
-        # Remove y-axis ticks
-        self.axes.tick_params(left=False)
+        # One pixel per time unit holding the running process's color (transparent while
+        # idle), scaled onto the block band in one draw; only new blocks get written
+        self._strip = None
+        self._strip_history = None
+        self._strip_blocks = 0
+        
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)  # Title, axis label and block labels
+    
+    def sizeHint(self):
+        return self._size_hint
     
     def update_chart(self, algorithm):
+        # Holding on to the history list (not just its id) means a reset, which
+        # replaces it, can never compare equal to what was drawn
+        history = algorithm.execution_history
+        drawn = self._drawn_state
+        if (drawn is not None and drawn[0] is algorithm and drawn[1] is history
+                and drawn[2:] == (algorithm.time, len(history))):
+            return
+        
         self.algorithm = algorithm
         self.processes = algorithm.processes
-        self.draw_gantt_chart()
+        self._drawn_state = (algorithm, history, algorithm.time, len(history))
+        self._update_strip(history)
+        self._pixmap = None
+        self.update()
     
-    def draw_gantt_chart(self):
-        self.axes.clear()
-        
-        if not self.algorithm or not self.algorithm.execution_history:
-            self.axes.set_title("No processes to display", color=TEXT_COLOR)
-            self.draw()
+    def _update_strip(self, history):
+        if history is not self._strip_history:
+            self._strip_history = history
+            self._strip_blocks = 0
+            self._strip = QImage(64, 1, QImage.Format_ARGB32)
+            self._strip.fill(Qt.transparent)
+        
+        # Grow by doubling so a long run is not copied on every step. The strip is never
+        # painted into: QPainter clips at about 32767 px, past which long runs would be lost.
+        # copy() pads the area beyond the old image with 0, which is transparent
+        end_time = self.algorithm._max_time
+        if end_time > self._strip.width():
+            self._strip = self._strip.copy(0, 0, max(end_time, 2 * self._strip.width()), 1)
+        
+        # The last block written may have kept running since, so it is written again
+        bits = self._strip.bits()
+        bits.setsize(self._strip.sizeInBytes())
+        pixels = np.frombuffer(bits, dtype=np.uint32)
+        for index in range(max(self._strip_blocks - 1, 0), len(history)):
+            start, pid, duration = history[index]
+            if duration > 0:
+                pixels[start:start + duration] = PROCESS_FILL_COLORS[Process.lut_index(pid)].rgba()
+        self._strip_blocks = len(history)
+    
+    @staticmethod
+    def _tick_step(end_time, max_ticks=10):
+        # Integer tick spacing of 1, 2 or 5 times a power of ten, like MaxNLocator(integer=True)
+        magnitude = 1
+        while True:
+            for factor in (1, 2, 5):
+                step = factor * magnitude
+                if end_time / step <= max_ticks:
+                    return step
+            magnitude *= 10
+    
+    def paintEvent(self, event):
+        ratio = self.devicePixelRatioF()
+        if (self._pixmap is None or self._pixmap.size() != self.size() * ratio or
+                self._pixmap.devicePixelRatioF() != ratio):
+            # Backing pixmap at device resolution, so the chart stays sharp on HiDPI screens
+            self._pixmap = QPixmap(self.size() * ratio)
+            self._pixmap.setDevicePixelRatio(ratio)
+            self._render(self._pixmap)
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._pixmap)
+        painter.end()
+    
+    def _render(self, device):
+        painter = QPainter(device)
+        painter.fillRect(self.rect(), DARK_QCOLOR)
+        
+        history = self.algorithm.execution_history if self.algorithm else []
+        painter.setFont(self._bold_font)
+        painter.setPen(TEXT_QCOLOR)
+        title_height = painter.fontMetrics().height() + 12
+        title_rect = QRect(0, 0, self.width(), title_height)
+        
+        if not history:
+            painter.drawText(title_rect, Qt.AlignCenter, "No processes to display")
+            painter.end()
             return
         
-        # Set up the chart area
-        max_time = max([h[0] + h[2] for h in self.algorithm.execution_history]) if self.algorithm.execution_history else 0
-        self.axes.set_xlim(0, max(max_time, 1))
-        self.axes.set_ylim(0, 1)
-        
-        # Draw each execution block
-        current_y = 0.1
-        block_height = 0.6
-        
-        # Process ID to color mapping
-        color_map = {p.pid: p.color for p in self.processes}
-        
-        # Draw execution blocks
-        for start, pid, duration in self.algorithm.execution_history:
+        painter.drawText(title_rect, Qt.AlignCenter, "Process Execution Gantt Chart")
+        
+        # Plot area, with time running from 0 to the end of the chart; below it go
+        # one row of tick labels and the axis label
+        metrics = painter.fontMetrics()
+        left = self.MARGIN_LEFT
+        top = title_height
+        plot_width = max(self.width() - self.MARGIN_LEFT - self.MARGIN_RIGHT, 1)
+        plot_height = max(self.height() - title_height - 2 * metrics.height() - 10, 1)
+        bottom = top + plot_height
+        end_time = max(self.algorithm._max_time, 1)
+        px_per_tick = plot_width / end_time
+        
+        # Vertical grid lines and time ticks
+        painter.setFont(self.font())
+        metrics = painter.fontMetrics()
+        step = self._tick_step(end_time)
+        for tick in range(0, end_time + 1, step):
+            x = round(left + tick * px_per_tick)
+            painter.setPen(GRID_QCOLOR)
+            painter.drawLine(x, top, x, bottom)
+            painter.setPen(TEXT_QCOLOR)
+            painter.drawLine(x, bottom, x, bottom + 4)
+            text = str(tick)
+            painter.drawText(x - metrics.horizontalAdvance(text) // 2, bottom + 6 + metrics.ascent(), text)
+        painter.setFont(self._bold_font)
+        painter.drawText(QRect(left, bottom + 6 + metrics.height(), plot_width, metrics.height()),
+                         Qt.AlignCenter, "Time")
+        
+        # Blocks sit in the same band as before: 0.1 to 0.7 of the plot height from the bottom
+        y = round(bottom - 0.7 * plot_height)
+        block_height = round(0.6 * plot_height)
+        
+        # All block fills in one scaled draw of the strip; smoothing only helps when
+        # several time units share a pixel, otherwise it would blur the block edges
+        if end_time > plot_width:
+            painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        painter.drawImage(QRectF(left, y, plot_width, block_height), self._strip, QRectF(0, 0, end_time, 1))
+        
+        # Outlines and labels only where the block is wide enough to show them
+        metrics = painter.fontMetrics()
+        border = QPen(Qt.black)
+        border.setWidth(1)
+        for start, pid, duration in history:
             if duration <= 0:
                 continue
-                
-            color = color_map.get(pid, 'gray')
-            rect = patches.Rectangle((start, current_y), duration, block_height, 
-                                    linewidth=1, edgecolor='black', facecolor=color, alpha=0.7)
-            self.axes.add_patch(rect)
-            
-            # Add process ID in the center of each block
-            if duration > 0.5:  # Only add text if the block is wide enough
-                self.axes.text(start + duration/2, current_y + block_height/2, f'P{pid}',
-                             ha='center', va='center', color='white', fontweight='bold')
-        
-        # Add grid and labels
-        self.axes.grid(True, alpha=0.3, axis='x')
-        self.axes.set_yticks([])
-        self.axes.set_xlabel('Time', fontweight='bold', color=TEXT_COLOR)
-        self.axes.set_title('Process Execution Gantt Chart', fontweight='bold', color=TEXT_COLOR)
-        
-        # Set tick labels
-        self.axes.xaxis.set_major_locator(plt.MaxNLocator(integer=True))
-        
-        self.draw()
+            x = round(left + start * px_per_tick)
+            w = round(left + (start + duration) * px_per_tick) - x
+            if w < 3:
+                continue
+            block = QRect(x, y, w, block_height)
+            painter.setPen(border)
+            painter.drawRect(block)
+            label = f'P{pid}'
+            if metrics.horizontalAdvance(label) + 4 <= w:
+                painter.setPen(Qt.white)
+                painter.drawText(block, Qt.AlignCenter, label)
+        
+        painter.end()
 
 
-class ProcessMetricsWidget(FigureCanvas):
+class MatplotlibMetricsWidget(FigureCanvas):
     def __init__(self, parent=None, width=8, height=4, dpi=100):
         self.fig = plt.Figure(figsize=(width, height), dpi=dpi, tight_layout=True)
         super().__init__(self.fig)
@@ -427,6 +774,7 @@ class ProcessMetricsWidget(FigureCanvas):
         
         self.setParent(parent)
         self.processes = []
+        self.proc_soa = {}
         
         # Set the colors
         self.fig.patch.set_facecolor(DARK_COLOR)
@@ -437,8 +785,11 @@ class ProcessMetricsWidget(FigureCanvas):
             ax.yaxis.label.set_color(TEXT_COLOR)
             ax.title.set_color(TEXT_COLOR)
         
-    def update_metrics(self, processes):
-        self.processes = processes
+    def update_metrics(self, algorithm):
+        self.processes = algorithm.processes
+        
+        # The scheduler keeps the plotted fields as one array per field already
+        self.proc_soa = algorithm.metrics_arrays()
         self.draw_metrics()
     
     def draw_metrics(self):
@@ -450,19 +801,16 @@ class ProcessMetricsWidget(FigureCanvas):
             self.draw()
             return
         
-        # Extract data
-        pids = [f'P{p.pid}' for p in self.processes]
-        waiting_times = [p.waiting_time for p in self.processes]
-        turnaround_times = [p.turnaround_time for p in self.processes]
-        burst_times = [p.burst_time for p in self.processes]
+        soa = self.proc_soa
+        pids = np.char.add('P', soa['pid'].astype(str))
         
         # Bar width and positions
         width = 0.35
         x = np.arange(len(pids))
         
         # Plot waiting and turnaround times
-        self.ax1.bar(x - width/2, waiting_times, width, label='Waiting Time', color=ACCENT_COLOR, alpha=0.7)
-        self.ax1.bar(x + width/2, turnaround_times, width, label='Turnaround Time', color=LIGHT_BLUE, alpha=0.7)
+        self.ax1.bar(x - width/2, soa['wait'], width, label='Waiting Time', color=ACCENT_COLOR, alpha=0.7)
+        self.ax1.bar(x + width/2, soa['turn'], width, label='Turnaround Time', color=LIGHT_BLUE, alpha=0.7)
         
         self.ax1.set_xlabel('Process ID')
         self.ax1.set_ylabel('Time')
@@ -473,7 +821,7 @@ class ProcessMetricsWidget(FigureCanvas):
         self.ax1.grid(True, alpha=0.3)
         
         # Plot burst times
-        bars = self.ax2.bar(x, burst_times, color=[p.color for p in self.processes], alpha=0.7)
+        bars = self.ax2.bar(x, soa['burst'], color=COLOR_LUT[soa['color_index']], alpha=0.7)
         
         self.ax2.set_xlabel('Process ID')
         self.ax2.set_ylabel('Time')
@@ -492,11 +840,113 @@ class ProcessMetricsWidget(FigureCanvas):
         self.draw()
 
 
-class ProcessTableWidget(QTableWidget):
+class PyQtGraphMetricsWidget(QWidget):
+    # Same two charts as MatplotlibMetricsWidget, drawn by pyqtgraph; the bar items
+    # and value labels are created once and updated in place
+    BAR_WIDTH = 0.35
+    
+    def __init__(self, parent=None, width=8, height=4, dpi=100):
+        super().__init__(parent)
+        self._size_hint = QSize(int(width * dpi), int(height * dpi))
+        self.processes = []
+        self.proc_soa = {}
+        
+        self.graphics = pg.GraphicsLayoutWidget()
+        self.graphics.setBackground(DARK_COLOR)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.graphics)
+        
+        # For waiting time and turnaround time, and for burst time
+        self.plot1 = self.graphics.addPlot(row=0, col=0)
+        self.plot2 = self.graphics.addPlot(row=0, col=1)
+        for plot in (self.plot1, self.plot2):
+            plot.setMenuEnabled(False)
+            plot.setMouseEnabled(x=False, y=False)
+            plot.hideButtons()
+            plot.showGrid(x=True, y=True, alpha=0.3)
+            for name in ('bottom', 'left'):
+                axis = plot.getAxis(name)
+                axis.setPen(TEXT_COLOR)
+                axis.setTextPen(TEXT_COLOR)
+            plot.setLabel('bottom', 'Process ID', color=TEXT_COLOR)
+            plot.setLabel('left', 'Time', color=TEXT_COLOR)
+        
+        wait_color = QColor(ACCENT_COLOR)
+        wait_color.setAlphaF(0.7)
+        turn_color = QColor(LIGHT_BLUE)
+        turn_color.setAlphaF(0.7)
+        self.plot1.addLegend(offset=(-10, 10), labelTextColor=TEXT_COLOR)
+        self.wait_bars = pg.BarGraphItem(x=[], height=[], width=self.BAR_WIDTH, brush=wait_color,
+                                         pen=None, name='Waiting Time')
+        self.turn_bars = pg.BarGraphItem(x=[], height=[], width=self.BAR_WIDTH, brush=turn_color,
+                                         pen=None, name='Turnaround Time')
+        self.burst_bars = pg.BarGraphItem(x=[], height=[], width=0.8, pen=None)
+        self.plot1.addItem(self.wait_bars)
+        self.plot1.addItem(self.turn_bars)
+        self.plot2.addItem(self.burst_bars)
+        self._burst_labels = []  # Value labels above the burst bars, reused across updates
+    
+    def sizeHint(self):
+        return self._size_hint
+    
+    def update_metrics(self, algorithm):
+        self.processes = algorithm.processes
+        
+        # The scheduler keeps the plotted fields as one array per field already
+        self.proc_soa = algorithm.metrics_arrays()
+        self.draw_metrics()
+    
+    def draw_metrics(self):
+        soa = self.proc_soa
+        count = len(self.processes)
+        x = np.arange(count)
+        
+        if not count:
+            self.plot1.setTitle("No process data available", color=TEXT_COLOR)
+            self.plot2.setTitle("")
+        else:
+            self.plot1.setTitle('Waiting and Turnaround Times', color=TEXT_COLOR)
+            self.plot2.setTitle('Burst Times', color=TEXT_COLOR)
+        
+        # Plot waiting and turnaround times; the bar items keep the arrays they are
+        # given, and the scheduler's own ones change under them as it runs
+        self.wait_bars.setOpts(x=x - self.BAR_WIDTH/2, height=soa['wait'].copy())
+        self.turn_bars.setOpts(x=x + self.BAR_WIDTH/2, height=soa['turn'].copy())
+        
+        # Plot burst times
+        brushes = [PROCESS_FILL_COLORS[index] for index in soa['color_index'].tolist()]
+        self.burst_bars.setOpts(x=x, height=soa['burst'].copy(), brushes=brushes)
+        self.plot2.setYRange(0, max(soa['burst'].max(initial=0), 1) * 1.15, padding=0)  # Room for the labels
+        
+        ticks = [list(zip(x.tolist(), (f'P{pid}' for pid in soa['pid'].tolist())))]
+        for plot in (self.plot1, self.plot2):
+            plot.getAxis('bottom').setTicks(ticks)
+            plot.setXRange(-0.6, max(count, 1) - 0.4, padding=0)
+        
+        # Add value labels on top of each bar
+        while len(self._burst_labels) < count:
+            label = pg.TextItem(color=TEXT_COLOR, anchor=(0.5, 1))
+            self.plot2.addItem(label)
+            self._burst_labels.append(label)
+        for index, label in enumerate(self._burst_labels):
+            if index < count:
+                height = soa['burst'][index]
+                label.setText(f'{height:.1f}')
+                label.setPos(index, height + 0.1)
+                label.show()
+            else:
+                label.hide()
+
+
+ProcessMetricsWidget = MatplotlibMetricsWidget if USE_MATPLOTLIB else PyQtGraphMetricsWidget
+
+
+class ProcessTableWidget(QTableView):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setStyleSheet(f"""
-            QTableWidget {{
+            QTableView {{
                 background-color: {DARK_COLOR};
                 color: {TEXT_COLOR};
                 gridline-color: {DARK_BLUE};
@@ -508,62 +958,126 @@ class ProcessTableWidget(QTableWidget):
                 padding: 5px;
                 border: 1px solid {DARK_BLUE};
             }}
-            QTableWidget::item {{
+            QTableView::item {{
                 padding: 5px;
             }}
-            QTableWidget::item:selected {{
+            QTableView::item:selected {{
                 background-color: {LIGHT_BLUE};
             }}
         """)
         
         # Set up the table
-        self.setColumnCount(7)
-        self.setHorizontalHeaderLabels([
+        self.table_model = QStandardItemModel(0, 7, self)
+        self.table_model.setHorizontalHeaderLabels([
             "PID", "Arrival Time", "Burst Time", "Start Time", 
             "Finish Time", "Waiting Time", "Turnaround Time"
         ])
+        self.setModel(self.table_model)
         
         # Set column widths
         header = self.horizontalHeader()
-        for i in range(self.columnCount()):
+        for i in range(self.table_model.columnCount()):
             header.setSectionResizeMode(i, QHeaderView.Stretch)
+        
+        # What is on screen, so an update with the same rows only rewrites changed cells
+        self._row_pids = []
+        self._row_items = {}  # pid -> that row's items
+        self._last_snapshot = {}  # pid -> texts of the row's non-PID cells
+    
+    @staticmethod
+    def make_item(text):
+        # Every cell in the table is center aligned
+        item = QStandardItem(text)
+        item.setTextAlignment(Qt.AlignCenter)
+        return item
+    
+    @staticmethod
+    def cell_texts(process):
+        # Texts for every column after PID, handling potentially None values
+        start_time = str(process.start_time) if process.start_time is not None else "-"
+        finish_time = str(process.finish_time) if process.finish_time is not None else "-"
+        return (str(process.arrival_time), str(process.burst_time), start_time, finish_time,
+                str(process.waiting_time), str(process.turnaround_time))
     
     def update_table(self, processes):
-        self.setRowCount(0)  # Clear the table
+        pids = [process.pid for process in processes]
+        if pids != self._row_pids:
+            self._rebuild_table(processes, pids)
+            return
+        
+        # Same rows as on screen: reuse the items and rewrite only the cells that
+        # changed, then report the changed rows to the view in one signal
+        model = self.table_model
+        changed_rows = []
+        model.blockSignals(True)
+        for process in processes:
+            texts = self.cell_texts(process)
+            last_texts = self._last_snapshot[process.pid]
+            if texts == last_texts:
+                continue
+            items = self._row_items[process.pid]
+            for column, (last_text, text) in enumerate(zip(last_texts, texts), 1):
+                if text != last_text:
+                    items[column].setText(text)
+            self._last_snapshot[process.pid] = texts
+            changed_rows.append(items[0].row())
+        model.blockSignals(False)
+        
+        if changed_rows:
+            model.dataChanged.emit(model.index(min(changed_rows), 0),
+                                   model.index(max(changed_rows), model.columnCount() - 1))
+    
+    def _rebuild_table(self, processes, pids):
+        model = self.table_model
+        header = self.horizontalHeader()
+        sorting_enabled = self.isSortingEnabled()
+        
+        # Fill the model with its signals blocked and tell the view once at the end,
+        # instead of a change notification for every cell. Sorting and column
+        # stretching are also held off until every row is in
+        self.setUpdatesEnabled(False)
+        self.setSortingEnabled(False)
+        header.setSectionResizeMode(QHeaderView.Fixed)
+        model.blockSignals(True)
+        model.setRowCount(0)  # Clear the table
+        self._row_pids = pids
+        self._row_items = {}
+        self._last_snapshot = {}
         
         # Add processes to the table
         for process in processes:
-            row_position = self.rowCount()
-            self.insertRow(row_position)
-            
-            # Set the data
-            self.setItem(row_position, 0, QTableWidgetItem(f"P{process.pid}"))
-            self.setItem(row_position, 1, QTableWidgetItem(str(process.arrival_time)))
-            self.setItem(row_position, 2, QTableWidgetItem(str(process.burst_time)))
-            
-            # Handle potentially None values
-            start_time = str(process.start_time) if process.start_time is not None else "-"
-            finish_time = str(process.finish_time) if process.finish_time is not None else "-"
-            
-            self.setItem(row_position, 3, QTableWidgetItem(start_time))
-            self.setItem(row_position, 4, QTableWidgetItem(finish_time))
-            self.setItem(row_position, 5, QTableWidgetItem(str(process.waiting_time)))
-            self.setItem(row_position, 6, QTableWidgetItem(str(process.turnaround_time)))
+            texts = self.cell_texts(process)
+            row = [self.make_item(f"P{process.pid}")] + [self.make_item(text) for text in texts]
             
             # Set color for the PID cell based on the process color
-            pid_item = self.item(row_position, 0)
-            color_tuple = [int(c * 255) for c in process.color[:3]]
-            pid_item.setBackground(QColor(*color_tuple))
-            
-            # Make text readable based on background brightness
-            brightness = sum(color_tuple) / 3
-            text_color = Qt.white if brightness < 128 else Qt.black
-            pid_item.setForeground(text_color)
+            pid_item = row[0]
+            pid_item.setBackground(PROCESS_BRUSHES[process.color_index])
+            pid_item.setForeground(PROCESS_TEXT_BRUSHES[process.color_index])
             
-            # Center align all items
-            for col in range(self.columnCount()):
-                item = self.item(row_position, col)
-                item.setTextAlignment(Qt.AlignCenter)
+            model.appendRow(row)
+            self._row_items[process.pid] = row
+            self._last_snapshot[process.pid] = texts
+        
+        model.blockSignals(False)
+        model.beginResetModel()
+        model.endResetModel()
+        header.setSectionResizeMode(QHeaderView.Stretch)
+        self.setSortingEnabled(sorting_enabled)
+        self.setUpdatesEnabled(True)
+
+
+class SchedulerRunWorker(QThread):
+    # Runs one scheduler to completion off the GUI thread
+    run_finished = pyqtSignal(str)
+    
+    def __init__(self, algorithm_name, scheduler, parent=None):
+        super().__init__(parent)
+        self.algorithm_name = algorithm_name
+        self.scheduler = scheduler
+    
+    def run(self):
+        self.scheduler.fast_run()
+        self.run_finished.emit(self.algorithm_name)
 
 
 class ProcessDashboardApp(QMainWindow):
@@ -662,6 +1176,8 @@ class ProcessDashboardApp(QMainWindow):
         
         # Initialize data
         self.processes = []
+        self._pids = set()  # pids in self.processes, for the duplicate check
+        self._max_pid = 0  # Highest pid in self.processes, for the next-pid suggestion
         self.schedulers = {
             "FCFS": FCFSScheduling(),
             "SJF (Non-preemptive)": SJFScheduling(preemptive=False),
@@ -670,21 +1186,43 @@ class ProcessDashboardApp(QMainWindow):
             "Priority (Non-preemptive)": PriorityScheduling(preemptive=False),
             "Priority (Preemptive)": PriorityScheduling(preemptive=True)
         }
-        
-        # Create tabs for each scheduling algorithm
+        self._tab_widgets = {}  # algorithm name -> weak registry of that tab's display widgets
+        self._run_workers = {}  # algorithm name -> its running SchedulerRunWorker
+        
+        # Display updates are collected and applied together once control returns to
+        # the event loop, so a burst of steps or resets repaints each tab once
+        self._pending_repaint = set()
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.timeout.connect(self._flush_repaints)
+        
+        # Create tabs for each scheduling algorithm; they stay empty placeholders
+        # until first shown, so startup only builds the charts of the visible tab
+        self._tab_built = {}  # tab index -> whether setup_algorithm_tab has run for it
         for name in self.schedulers.keys():
             tab = QWidget()
             self.tab_widget.addTab(tab, name)
-            self.setup_algorithm_tab(tab, name)
         
         # Setup process management tab
         process_tab = QWidget()
         self.tab_widget.addTab(process_tab, "Process Management")
         self.setup_process_management_tab(process_tab)
         
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
+        self._ensure_tab_built(self.tab_widget.currentIndex())
+        
         # Add some sample processes
         self.add_sample_processes()
     
+    def _ensure_tab_built(self, index):
+        algorithm_names = list(self.schedulers)
+        if not 0 <= index < len(algorithm_names) or self._tab_built.get(index):
+            return
+        algorithm_name = algorithm_names[index]
+        self.setup_algorithm_tab(self.tab_widget.widget(index), algorithm_name)
+        self._tab_built[index] = True
+        self.update_algorithm_display(algorithm_name)
+    
     def setup_algorithm_tab(self, tab, algorithm_name):
         layout = QVBoxLayout(tab)
         
@@ -711,7 +1249,6 @@ class ProcessDashboardApp(QMainWindow):
         
         # Current time display
         time_label = QLabel("Current Time: 0")
-        time_label.setObjectName(f"{algorithm_name}_time_label")
         controls_layout.addWidget(time_label)
         
         layout.addLayout(controls_layout)
@@ -725,7 +1262,6 @@ class ProcessDashboardApp(QMainWindow):
         
         # Gantt Chart
         gantt_chart = GanttChartWidget(width=10, height=2)
-        gantt_chart.setObjectName(f"{algorithm_name}_gantt")
         upper_layout.addWidget(gantt_chart)
         
         # Summary metrics
@@ -733,31 +1269,26 @@ class ProcessDashboardApp(QMainWindow):
         
         # Avg. Waiting Time
         avg_waiting_label = QLabel("Avg. Waiting Time: 0.0")
-        avg_waiting_label.setObjectName(f"{algorithm_name}_avg_waiting")
         metrics_layout.addWidget(avg_waiting_label)
         
         # Avg. Turnaround Time
         avg_tat_label = QLabel("Avg. Turnaround Time: 0.0")
-        avg_tat_label.setObjectName(f"{algorithm_name}_avg_tat")
         metrics_layout.addWidget(avg_tat_label)
         
         # Avg. Response Time
         avg_response_label = QLabel("Avg. Response Time: 0.0")
-        avg_response_label.setObjectName(f"{algorithm_name}_avg_response")
         metrics_layout.addWidget(avg_response_label)
         
         upper_layout.addLayout(metrics_layout)
         
         # Process metrics charts
         process_metrics = ProcessMetricsWidget(width=10, height=4)
-        process_metrics.setObjectName(f"{algorithm_name}_metrics")
         upper_layout.addWidget(process_metrics)
         
         splitter.addWidget(upper_widget)
         
         # Process table
         process_table = ProcessTableWidget()
-        process_table.setObjectName(f"{algorithm_name}_table")
         splitter.addWidget(process_table)
         
         layout.addWidget(splitter)
@@ -765,6 +1296,19 @@ class ProcessDashboardApp(QMainWindow):
         # Set initial stretch factors
         splitter.setStretchFactor(0, 2)
         splitter.setStretchFactor(1, 1)
+        
+        # Keep the widgets the display updates write to
+        for key, widget in (("tab", tab), ("time", time_label), ("gantt", gantt_chart),
+                            ("metrics", process_metrics), ("table", process_table),
+                            ("avg_waiting", avg_waiting_label), ("avg_tat", avg_tat_label),
+                            ("avg_response", avg_response_label)):
+            self._register_widget(algorithm_name, key, widget)
+    
+    def _register_widget(self, algorithm_name, key, widget):
+        # Held weakly, so an entry disappears by itself once Qt destroys the widget
+        widgets = self._tab_widgets.setdefault(algorithm_name, weakref.WeakValueDictionary())
+        assert key not in widgets, f"{algorithm_name} already has a {key!r} widget"
+        widgets[key] = widget
     
     def setup_process_management_tab(self, tab):
         layout = QVBoxLayout(tab)
@@ -830,25 +1374,32 @@ class ProcessDashboardApp(QMainWindow):
         priority = self.priority_input.value()
         
         # Check if process ID already exists
-        if any(p.pid == pid for p in self.processes):
+        if pid in self._pids:
             QMessageBox.warning(self, "Duplicate ID", "A process with this ID already exists!")
             return
         
         process = Process(pid, arrival_time, burst_time, priority)
         self.processes.append(process)
+        self._pids.add(pid)
+        self._max_pid = max(self._max_pid, pid)
         
-        # Reset input values
-        self.pid_input.setValue(max([p.pid for p in self.processes], default=0) + 1)
-        self.arrival_input.setValue(0)
-        self.burst_input.setValue(1)
-        self.priority_input.setValue(1)
+        # Reset input values; nothing needs their valueChanged signals for this
+        with QSignalBlocker(self.pid_input), QSignalBlocker(self.arrival_input), \
+                QSignalBlocker(self.burst_input), QSignalBlocker(self.priority_input):
+            self.pid_input.setValue(self._max_pid + 1)
+            self.arrival_input.setValue(0)
+            self.burst_input.setValue(1)
+            self.priority_input.setValue(1)
         
         # Update process table and all algorithm tabs
-        self.update_process_displays()
+        self.update_process_displays(added=process)
     
     def clear_processes(self):
         self.processes = []
-        self.pid_input.setValue(1)
+        self._pids = set()
+        self._max_pid = 0
+        with QSignalBlocker(self.pid_input):
+            self.pid_input.setValue(1)
         self.update_process_displays()
     
     def add_sample_processes(self):
@@ -859,23 +1410,36 @@ class ProcessDashboardApp(QMainWindow):
             Process(4, 3, 2, 1),
             Process(5, 4, 4, 5)
         ]
-        self.pid_input.setValue(len(self.processes) + 1)
+        self._pids = {p.pid for p in self.processes}
+        self._max_pid = max(self._pids)
+        with QSignalBlocker(self.pid_input):
+            self.pid_input.setValue(self._max_pid + 1)
         self.update_process_displays()
     
-    def update_process_displays(self):
+    def update_process_displays(self, added=None):
+        # `added` is a process just appended to self.processes: the schedulers then
+        # only need that one, rather than a fresh copy of the whole list
         # Update the process table in the management tab
         self.process_table.update_table(self.processes)
         
-        # Update all algorithm tabs
-        for name, scheduler in self.schedulers.items():
-            # Create a deep copy of the processes for each scheduler
-            scheduler.processes = [
-                Process(p.pid, p.arrival_time, p.burst_time, p.priority) 
-                for p in self.processes
-            ]
-            
-            # Reset the algorithm
-            self.reset_algorithm(name)
+        # The schedulers are about to be replaced, so let any background run finish first
+        for name in list(self._run_workers):
+            self._release_run_worker(name)
+        
+        # Update all algorithm tabs, repainting once at the end rather than per tab
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            for name, scheduler in self.schedulers.items():
+                # Each scheduler runs its own copies of the processes
+                if added is not None:
+                    scheduler.add_process(added.clone())
+                else:
+                    scheduler.processes = [p.clone() for p in self.processes]
+                
+                # Reset the algorithm
+                self.reset_algorithm(name, force=True)
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
     
     def step_algorithm(self, algorithm_name):
         scheduler = self.schedulers[algorithm_name]
@@ -888,59 +1452,94 @@ class ProcessDashboardApp(QMainWindow):
             QMessageBox.information(self, "Complete", "All processes have completed execution!")
     
     def run_algorithm(self, algorithm_name):
+        if algorithm_name in self._run_workers:
+            return
         scheduler = self.schedulers[algorithm_name]
         
-        # Run until completion
-        while scheduler.step():
-            pass
+        # Run until completion on a worker thread; the tab is frozen (no input, no
+        # repaints of the half-finished state) until the result comes back
+        tab = self._tab_widgets[algorithm_name]["tab"]
+        tab.setEnabled(False)
+        tab.setUpdatesEnabled(False)
+        worker = SchedulerRunWorker(algorithm_name, scheduler, self)
+        worker.run_finished.connect(self._on_run_finished)
+        self._run_workers[algorithm_name] = worker
+        worker.start()
+    
+    def _release_run_worker(self, algorithm_name):
+        # Wait for a run's worker, drop it and unfreeze its tab; False if already released
+        worker = self._run_workers.pop(algorithm_name, None)
+        if worker is None:
+            return False
+        worker.wait()
+        worker.deleteLater()
+        
+        tab = self._tab_widgets[algorithm_name]["tab"]
+        tab.setUpdatesEnabled(True)
+        tab.setEnabled(True)
+        return True
+    
+    def _on_run_finished(self, algorithm_name):
+        # A process list change may have released the worker (and reset the scheduler) already
+        if not self._release_run_worker(algorithm_name):
+            return
         
         # Update the UI
         self.update_algorithm_display(algorithm_name)
         QMessageBox.information(self, "Complete", "All processes have completed execution!")
     
-    def reset_algorithm(self, algorithm_name):
+    def reset_algorithm(self, algorithm_name, force=False):
+        # A scheduler that has not run since its last reset is already showing that
+        # state; `force` is for when its process list changed underneath it
         scheduler = self.schedulers[algorithm_name]
+        if scheduler._is_fresh and not force:
+            return
         scheduler.reset()
         
         # Update the UI
         self.update_algorithm_display(algorithm_name)
     
+    def closeEvent(self, event):
+        # A QThread must not be destroyed while it is still running
+        for name in list(self._run_workers):
+            self._release_run_worker(name)
+        super().closeEvent(event)
+    
     def update_algorithm_display(self, algorithm_name):
+        self._pending_repaint.add(algorithm_name)
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start(0)
+    
+    def _flush_repaints(self):
+        pending = self._pending_repaint
+        self._pending_repaint = set()
+        for algorithm_name in self.schedulers:
+            # A tab with a run in progress is refreshed when the run finishes, and one not
+            # built yet when it is first shown
+            if (algorithm_name in pending and algorithm_name in self._tab_widgets
+                    and algorithm_name not in self._run_workers):
+                self._refresh_algorithm_display(algorithm_name)
+    
+    def _refresh_algorithm_display(self, algorithm_name):
         scheduler = self.schedulers[algorithm_name]
+        widgets = self._tab_widgets[algorithm_name]
         
         # Update time label
-        time_label = self.findChild(QLabel, f"{algorithm_name}_time_label")
-        if time_label:
-            time_label.setText(f"Current Time: {scheduler.time}")
+        widgets["time"].setText(f"Current Time: {scheduler.time}")
         
         # Update Gantt chart
-        gantt_chart = self.findChild(GanttChartWidget, f"{algorithm_name}_gantt")
-        if gantt_chart:
-            gantt_chart.update_chart(scheduler)
+        widgets["gantt"].update_chart(scheduler)
         
         # Update process metrics
-        process_metrics = self.findChild(ProcessMetricsWidget, f"{algorithm_name}_metrics")
-        if process_metrics:
-            process_metrics.update_metrics(scheduler.processes)
+        widgets["metrics"].update_metrics(scheduler)
         
         # Update process table
-        process_table = self.findChild(ProcessTableWidget, f"{algorithm_name}_table")
-        if process_table:
-            process_table.update_table(scheduler.processes)
+        widgets["table"].update_table(scheduler.processes)
         
         # Update average metrics
-        avg_waiting_label = self.findChild(QLabel, f"{algorithm_name}_avg_waiting")
-        avg_tat_label = self.findChild(QLabel, f"{algorithm_name}_avg_tat")
-        avg_response_label = self.findChild(QLabel, f"{algorithm_name}_avg_response")
-        
-        if avg_waiting_label:
-            avg_waiting_label.setText(f"Avg. Waiting Time: {scheduler.get_average_waiting_time():.2f}")
-        
-        if avg_tat_label:
-            avg_tat_label.setText(f"Avg. Turnaround Time: {scheduler.get_average_turnaround_time():.2f}")
-        
-        if avg_response_label:
-            avg_response_label.setText(f"Avg. Response Time: {scheduler.get_average_response_time():.2f}")
+        widgets["avg_waiting"].setText(f"Avg. Waiting Time: {scheduler.get_average_waiting_time():.2f}")
+        widgets["avg_tat"].setText(f"Avg. Turnaround Time: {scheduler.get_average_turnaround_time():.2f}")
+        widgets["avg_response"].setText(f"Avg. Response Time: {scheduler.get_average_response_time():.2f}")
 
 
 # Run the application
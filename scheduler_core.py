@@ -0,0 +1,308 @@
+from functools import lru_cache
+
+import numpy as np
+
+# Compiled run-to-completion kernels for the schedulers in python.py.
+# Each kernel replays the same event-driven loop as the matching step() method,
+# on plain int64 arrays indexed in arrival order (ties keep their original order).
+# They all return:
+#   (start, finish, response, order, hist_start, hist_proc, hist_dur, end_time)
+# where order is the completion order and hist_proc indexes into the input arrays.
+# The *_kernel() factories below return versions with the algorithm's settings
+# baked in; those are what the schedulers call. Those and run_fcfs release the GIL,
+# so a run on a worker thread leaves the GUI thread free.
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Without numba the kernels still work, just interpreted; callers should
+    # prefer the Python step() loop in that case
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _run_length(t, limit, next_arrival, arrival):
+    # Same rule as SchedulingAlgorithm._run_length with no max_dt; limit < 0 means none
+    dt = limit
+    if next_arrival < arrival.shape[0]:
+        until_arrival = arrival[next_arrival] - t
+        if dt < 0 or until_arrival < dt:
+            dt = until_arrival
+    if dt < 0:
+        dt = 1
+    return dt
+
+
+@njit(cache=True)
+def _heap_less(hkey, hseq, i, j):
+    return hkey[i] < hkey[j] or (hkey[i] == hkey[j] and hseq[i] < hseq[j])
+
+
+@njit(cache=True)
+def _heap_swap(hkey, hseq, hidx, i, j):
+    hkey[i], hkey[j] = hkey[j], hkey[i]
+    hseq[i], hseq[j] = hseq[j], hseq[i]
+    hidx[i], hidx[j] = hidx[j], hidx[i]
+
+
+@njit(cache=True)
+def _heap_push(hkey, hseq, hidx, size, key, seq, idx):
+    # Min-heap on (key, seq); seq is unique, so pops come out in a fixed order
+    i = size
+    hkey[i] = key
+    hseq[i] = seq
+    hidx[i] = idx
+    while i > 0:
+        parent = (i - 1) // 2
+        if not _heap_less(hkey, hseq, i, parent):
+            break
+        _heap_swap(hkey, hseq, hidx, i, parent)
+        i = parent
+    return size + 1
+
+
+@njit(cache=True)
+def _heap_pop(hkey, hseq, hidx, size):
+    idx = hidx[0]
+    size -= 1
+    hkey[0] = hkey[size]
+    hseq[0] = hseq[size]
+    hidx[0] = hidx[size]
+    i = 0
+    while True:
+        smallest = i
+        left = 2 * i + 1
+        right = left + 1
+        if left < size and _heap_less(hkey, hseq, left, smallest):
+            smallest = left
+        if right < size and _heap_less(hkey, hseq, right, smallest):
+            smallest = right
+        if smallest == i:
+            break
+        _heap_swap(hkey, hseq, hidx, i, smallest)
+        i = smallest
+    return idx, size
+
+
+@njit(cache=True, nogil=True)
+def run_fcfs(arrival, burst):
+    n = arrival.shape[0]
+    remaining = burst.copy()
+    start = np.full(n, -1, np.int64)
+    finish = np.full(n, -1, np.int64)
+    response = np.full(n, -1, np.int64)
+    order = np.empty(n, np.int64)
+    # Every block runs at least one tick, so the total burst bounds the block count
+    capacity = max(1, burst.sum())
+    hist_start = np.empty(capacity, np.int64)
+    hist_proc = np.empty(capacity, np.int64)
+    hist_dur = np.empty(capacity, np.int64)
+
+    # Nothing is ever requeued, so the queue is the arrival order itself
+    queue_head = 0
+    next_arrival = 0
+    done = 0
+    blocks = 0
+    current = -1
+    t = 0
+    while done < n:
+        while next_arrival < n and arrival[next_arrival] <= t:
+            next_arrival += 1
+
+        if current < 0 and queue_head < next_arrival:
+            current = queue_head
+            queue_head += 1
+            start[current] = t
+            response[current] = t - arrival[current]
+            hist_start[blocks] = t
+            hist_proc[blocks] = current
+            hist_dur[blocks] = 0
+            blocks += 1
+
+        dt = _run_length(t, remaining[current] if current >= 0 else -1, next_arrival, arrival)
+        if current >= 0:
+            remaining[current] -= dt
+            hist_dur[blocks - 1] += dt
+            if remaining[current] == 0:
+                finish[current] = t + dt
+                order[done] = current
+                done += 1
+                current = -1
+        t += dt
+
+    return start, finish, response, order, hist_start[:blocks], hist_proc[:blocks], hist_dur[:blocks], t
+
+
+@njit(cache=True)
+def _run_keyed(arrival, burst, priority, by_remaining, preemptive):
+    # Shared by SJF (key = remaining time) and Priority (key = priority)
+    n = arrival.shape[0]
+    remaining = burst.copy()
+    start = np.full(n, -1, np.int64)
+    finish = np.full(n, -1, np.int64)
+    response = np.full(n, -1, np.int64)
+    order = np.empty(n, np.int64)
+    capacity = max(1, burst.sum())
+    hist_start = np.empty(capacity, np.int64)
+    hist_proc = np.empty(capacity, np.int64)
+    hist_dur = np.empty(capacity, np.int64)
+
+    hkey = np.empty(max(1, n), np.int64)
+    hseq = np.empty(max(1, n), np.int64)
+    hidx = np.empty(max(1, n), np.int64)
+    size = 0
+    seq = 0
+    next_arrival = 0
+    done = 0
+    blocks = 0
+    current = -1
+    t = 0
+    while done < n:
+        while next_arrival < n and arrival[next_arrival] <= t:
+            key = remaining[next_arrival] if by_remaining else priority[next_arrival]
+            size = _heap_push(hkey, hseq, hidx, size, key, seq, next_arrival)
+            seq += 1
+            next_arrival += 1
+
+        dispatch = False
+        if preemptive and current >= 0 and size > 0:
+            current_key = remaining[current] if by_remaining else priority[current]
+            # A tie with the heap head also preempts, as in step()
+            if hkey[0] <= current_key:
+                chosen, size = _heap_pop(hkey, hseq, hidx, size)
+                size = _heap_push(hkey, hseq, hidx, size, current_key, seq, current)
+                seq += 1
+                current = chosen
+                dispatch = True
+
+        if current < 0 and size > 0:
+            current, size = _heap_pop(hkey, hseq, hidx, size)
+            dispatch = True
+
+        if dispatch:
+            start[current] = t
+            if response[current] < 0:
+                response[current] = t - arrival[current]
+            hist_start[blocks] = t
+            hist_proc[blocks] = current
+            hist_dur[blocks] = 0
+            blocks += 1
+
+        limit = -1
+        if current >= 0:
+            limit = remaining[current]
+            # Equal priorities swap every tick under preemption
+            if preemptive and not by_remaining and size > 0 and hkey[0] <= priority[current]:
+                limit = 1
+        dt = _run_length(t, limit, next_arrival, arrival)
+        if current >= 0:
+            remaining[current] -= dt
+            hist_dur[blocks - 1] += dt
+            if remaining[current] == 0:
+                finish[current] = t + dt
+                order[done] = current
+                done += 1
+                current = -1
+        t += dt
+
+    return start, finish, response, order, hist_start[:blocks], hist_proc[:blocks], hist_dur[:blocks], t
+
+
+@njit(cache=True)
+def run_rr(arrival, burst, time_quantum):
+    n = arrival.shape[0]
+    remaining = burst.copy()
+    start = np.full(n, -1, np.int64)
+    finish = np.full(n, -1, np.int64)
+    response = np.full(n, -1, np.int64)
+    order = np.empty(n, np.int64)
+    capacity = max(1, burst.sum())
+    hist_start = np.empty(capacity, np.int64)
+    hist_proc = np.empty(capacity, np.int64)
+    hist_dur = np.empty(capacity, np.int64)
+
+    # Circular FIFO; at most n processes are ever queued at once
+    queue_size = max(1, n)
+    queue = np.empty(queue_size, np.int64)
+    queue_head = 0
+    queue_len = 0
+    next_arrival = 0
+    done = 0
+    blocks = 0
+    current = -1
+    time_slice = 0
+    t = 0
+    while done < n:
+        while next_arrival < n and arrival[next_arrival] <= t:
+            queue[(queue_head + queue_len) % queue_size] = next_arrival
+            queue_len += 1
+            next_arrival += 1
+
+        if (current < 0 or time_slice >= time_quantum) and queue_len > 0:
+            if current >= 0:
+                queue[(queue_head + queue_len) % queue_size] = current
+                queue_len += 1
+            current = queue[queue_head]
+            queue_head = (queue_head + 1) % queue_size
+            queue_len -= 1
+            start[current] = t
+            if response[current] < 0:
+                response[current] = t - arrival[current]
+            time_slice = 0
+            hist_start[blocks] = t
+            hist_proc[blocks] = current
+            hist_dur[blocks] = 0
+            blocks += 1
+
+        limit = -1
+        if current >= 0:
+            limit = remaining[current]
+            if time_slice < time_quantum:
+                limit = min(limit, time_quantum - time_slice)
+        dt = _run_length(t, limit, next_arrival, arrival)
+        if current >= 0:
+            remaining[current] -= dt
+            time_slice += dt
+            hist_dur[blocks - 1] += dt
+            if remaining[current] == 0:
+                finish[current] = t + dt
+                order[done] = current
+                done += 1
+                current = -1
+                time_slice = 0
+        t += dt
+
+    return start, finish, response, order, hist_start[:blocks], hist_proc[:blocks], hist_dur[:blocks], t
+
+
+# Per-settings kernels: each factory closes over the algorithm's settings, which numba
+# treats as constants of that compiled kernel, and the result is cached on disk per
+# settings value.
+@lru_cache(maxsize=None)
+def sjf_kernel(preemptive):
+    @njit(cache=True, nogil=True)
+    def kernel(arrival, burst):
+        return _run_keyed(arrival, burst, burst, True, preemptive)
+    return kernel
+
+
+@lru_cache(maxsize=None)
+def priority_kernel(preemptive):
+    @njit(cache=True, nogil=True)
+    def kernel(arrival, burst, priority):
+        return _run_keyed(arrival, burst, priority, False, preemptive)
+    return kernel
+
+
+@lru_cache(maxsize=None)
+def rr_kernel(time_quantum):
+    @njit(cache=True, nogil=True)
+    def kernel(arrival, burst):
+        return run_rr(arrival, burst, time_quantum)
+    return kernel